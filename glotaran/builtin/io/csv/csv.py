@@ -1,16 +1,42 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from glotaran.io import ProjectIoInterface
 from glotaran.io import register_project_io
 from glotaran.parameter import ParameterGroup
 
+# Boolean columns are left to type inference, since an explicit 'boolean'
+# dtype yields numpy bools which ``ParameterGroup.from_dataframe`` rejects.
+# Dtypes of columns not present in a file are ignored by ``pd.read_csv``.
+PARAMETER_COLUMN_DTYPES = {
+    "label": str,
+    "value": "float64",
+    "minimum": "float64",
+    "maximum": "float64",
+    "expression": str,
+}
+
 
 @register_project_io(["csv"])
 class CsvProjectIo(ProjectIoInterface):
     def load_parameters(self, file_name: str) -> ParameterGroup:
-        df = pd.read_csv(file_name, skipinitialspace=True, na_values=["None", "none"])
+        read_csv_kwargs = {"skipinitialspace": True, "na_values": ["None", "none"]}
+        try:
+            df = pd.read_csv(
+                file_name, dtype=PARAMETER_COLUMN_DTYPES, low_memory=False, **read_csv_kwargs
+            )
+        except ValueError:
+            # Columns with malformed values, fall back to type inference so
+            # 'ParameterGroup.from_dataframe' can raise a descriptive error
+            df = pd.read_csv(file_name, **read_csv_kwargs)
+        for column_name, fill_value in (("minimum", -np.inf), ("maximum", np.inf)):
+            if column_name in df and df[column_name].hasnans:
+                # Fill missing bounds on the numpy level instead of a 'fillna' on the frame
+                values = df[column_name].to_numpy(copy=True)
+                np.copyto(values, fill_value, where=pd.isna(values))
+                df[column_name] = values
         return ParameterGroup.from_dataframe(df, source=file_name)
 
     def save_parameters(self, parameters: ParameterGroup, file_name: str, *, sep=","):
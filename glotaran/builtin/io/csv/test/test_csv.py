@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from glotaran.io import load_parameters
+from glotaran.io import save_parameters
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PARAMETERS = """
+b:
+    - ["1", 0.25, {vary: false, min: 0, max: 8}]
+    - ["2", 0.75, {expr: '1 - $b.1', non-negative: true}]
+rates:
+    - ["total", 2]
+    - ["branch1", {expr: 'max($rates.total, $b.1)'}]
+    - ["small", 1e-8]
+"""
+
+MISSING_BOUNDS_CSV = """\
+label,value,minimum,maximum
+rates.k1,0.5,None,1
+rates.k2,0.2,0,
+"""
+
+
+@pytest.mark.parametrize("file_name", ("parameters.csv", "parameters.csv.gz"))
+def test_save_parameters_round_trip(tmp_path: Path, file_name: str):
+    """Saved parameters can be loaded again, also with inferred compression."""
+    parameters = load_parameters(PARAMETERS, format_name="yml_str")
+    csv_path = tmp_path / file_name
+
+    save_parameters(parameters, csv_path, "csv")
+    loaded = load_parameters(csv_path, format_name="csv")
+
+    for label, parameter in parameters.all():
+        loaded_parameter = loaded.get(label)
+        assert parameter.value == loaded_parameter.value
+        assert parameter.minimum == loaded_parameter.minimum
+        assert parameter.maximum == loaded_parameter.maximum
+        assert parameter.vary == loaded_parameter.vary
+        assert parameter.non_negative == loaded_parameter.non_negative
+        assert parameter.expression == loaded_parameter.expression
+
+
+def test_load_parameters_missing_bounds(tmp_path: Path):
+    """Missing minimum and maximum values are treated as unbounded."""
+    csv_path = tmp_path / "parameters.csv"
+    csv_path.write_text(MISSING_BOUNDS_CSV)
+
+    parameters = load_parameters(csv_path)
+
+    assert parameters.get("rates.k1").minimum == -np.inf
+    assert parameters.get("rates.k1").maximum == 1
+    assert parameters.get("rates.k2").minimum == 0
+    assert parameters.get("rates.k2").maximum == np.inf
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from glotaran.builtin.io.yml.yml import YmlProjectIo
+from glotaran.builtin.io.yml.yml import _cached_yaml_load
+from glotaran.builtin.io.yml.yml import _cached_yaml_str_load
+from glotaran.io import load_parameters
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_load_yml_cache_invalidation(tmp_path: Path):
+    """Changing a file invalidates the cached content."""
+    _cached_yaml_load.cache_clear()
+    parameters_path = tmp_path / "parameters.yml"
+
+    parameters_path.write_text("rates: [1.0, 2.0]")
+    assert load_parameters(parameters_path).get("rates.1").value == 1.0
+    assert load_parameters(parameters_path).get("rates.1").value == 1.0
+    assert _cached_yaml_load.cache_info().hits == 1
+
+    parameters_path.write_text("rates: [10.0, 2.0]")
+    assert load_parameters(parameters_path).get("rates.1").value == 10.0
+    assert _cached_yaml_load.cache_info().misses == 2
+
+
+def test_load_yml_cache_relative_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Equal relative paths in different working directories don't share a cache entry."""
+    _cached_yaml_load.cache_clear()
+    for folder, value in (("a", "1.0"), ("b", "5.0")):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "parameters.yml").write_text(f"rates: [{value}]")
+    mtime_ns = (tmp_path / "a" / "parameters.yml").stat().st_mtime_ns
+    os.utime(tmp_path / "b" / "parameters.yml", ns=(mtime_ns, mtime_ns))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert load_parameters("parameters.yml").get("rates.1").value == 1.0
+    monkeypatch.chdir(tmp_path / "b")
+    assert load_parameters("parameters.yml").get("rates.1").value == 5.0
+
+
+def test_load_yml_returns_copy(tmp_path: Path):
+    """Mutating a loaded spec does not change the cached content."""
+    _cached_yaml_load.cache_clear()
+    parameters_path = tmp_path / "parameters.yml"
+    parameters_path.write_text("rates: [1.0, 2.0]")
+    project_io = YmlProjectIo("yml")
+
+    spec = project_io._load_yml(parameters_path)
+    spec["rates"].append(3.0)
+    spec["new"] = [4.0]
+
+    assert project_io._load_yml(parameters_path) == {"rates": [1.0, 2.0]}
+    assert _cached_yaml_load.cache_info().hits == 1
+
+
+def test_load_yml_str_cache():
+    """Strings are cached and each load returns a copy."""
+    _cached_yaml_str_load.cache_clear()
+    project_io = YmlProjectIo("yml_str")
+
+    spec = project_io._load_yml("rates: [1.0, 2.0]")
+    spec["rates"].append(3.0)
+
+    assert project_io._load_yml("rates: [1.0, 2.0]") == {"rates": [1.0, 2.0]}
+    assert project_io._load_yml("rates: [10.0, 2.0]") == {"rates": [10.0, 2.0]}
+    assert _cached_yaml_str_load.cache_info().hits == 1
+    assert _cached_yaml_str_load.cache_info().misses == 2
+
+
+def test_load_yml_pure_python_fallback(tmp_path: Path):
+    """Specs rejected by libyaml but accepted by the pure python parser still load."""
+    parameters_path = tmp_path / "parameters.yml"
+    parameters_path.write_text(
+        "foo:\n  - [\"1\", 123,{non-negative: true, min: 10, max: 8e2, vary: true, expr:'2'}]"
+    )
+
+    parameter = load_parameters(parameters_path).get("foo.1")
+
+    assert parameter.value == 123
+    assert parameter.minimum == 10
+    assert parameter.maximum == 800
+    assert parameter.non_negative
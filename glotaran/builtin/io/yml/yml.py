@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import os
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 
 from ruamel.yaml import YAML
+from ruamel.yaml.error import YAMLError
 
 from glotaran.deprecation.modules.builtin_io_yml import model_spec_deprecations
 from glotaran.deprecation.modules.builtin_io_yml import scheme_spec_deprecations
@@ -19,7 +24,6 @@ from glotaran.project.dataclass_helpers import fromdict
 from glotaran.utils.sanitize import sanitize_yaml
 
 if TYPE_CHECKING:
-    from typing import Any
     from typing import Mapping
 
     from ruamel.yaml.nodes import ScalarNode
@@ -80,9 +84,10 @@ class YmlProjectIo(ProjectIoInterface):
             item_iterator = items if isinstance(items, list) else items.values()
             for item in item_iterator:
                 for prop_name, prop in item.items():
-                    if isinstance(prop, dict) and any(isinstance(k, tuple) for k in prop):
-                        keys = [f"({k[0]}, {k[1]})" for k in prop]
-                        item[prop_name] = {f"{k}": v for k, v in zip(keys, prop.values())}
+                    # Dicts with tuple keys (e.g. the k-matrix) only have tuple keys,
+                    # so checking the first key is sufficient
+                    if isinstance(prop, dict) and isinstance(next(iter(prop), None), tuple):
+                        item[prop_name] = {f"({k[0]}, {k[1]})": v for k, v in prop.items()}
         _write_dict(file_name, model_dict)
 
     def load_parameters(self, file_name: str) -> ParameterGroup:
@@ -145,13 +150,81 @@ class YmlProjectIo(ProjectIoInterface):
         _write_dict(result_path, result_dict)
 
     def _load_yml(self, file_name: str) -> dict:
-        yaml = YAML()
         if self.format == "yml_str":
-            spec = yaml.load(file_name)
+            spec = _cached_yaml_str_load(file_name)
         else:
-            with open(file_name) as f:
-                spec = yaml.load(f)
-        return spec
+            # Relative paths would collide across working directories
+            file_path = os.path.abspath(file_name)
+            file_stat = os.stat(file_path)
+            spec = _cached_yaml_load(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+        # The loaders modify the spec in place, so the cached value must not be handed out
+        return deepcopy(spec)
+
+
+@lru_cache(maxsize=512)
+def _cached_yaml_load(file_path: str, mtime: int, size: int) -> Any:
+    """Parse a yaml file, caching the result as long as the file is unchanged.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the yaml file.
+    mtime : int
+        Modification time of the file in nanoseconds, only used as part of the cache key.
+    size : int
+        Size of the file in bytes, only used as part of the cache key.
+
+    Returns
+    -------
+    Any
+        Parsed content of the file.
+    """
+    # Reading bytes skips the text decoding layer and lets the parser detect the encoding.
+    with open(file_path, "rb") as f:
+        return _parse_yaml(f.read())
+
+
+# The string itself is the cache key, so the cache is kept small to not hold on to many
+# large specs. Inline specs are mostly a few strings loaded repeatedly (e.g. in notebooks).
+@lru_cache(maxsize=16)
+def _cached_yaml_str_load(yml_str: str) -> Any:
+    """Parse a yaml string, caching the result.
+
+    Parameters
+    ----------
+    yml_str : str
+        Yaml formatted string.
+
+    Returns
+    -------
+    Any
+        Parsed content of the string.
+    """
+    return _parse_yaml(yml_str)
+
+
+def _parse_yaml(content: str | bytes) -> Any:
+    """Parse yaml content using the C based parser if possible.
+
+    The 'safe' loader uses the C based parser from 'ruamel.yaml.clib' if it is available.
+    Since libyaml is stricter than the pure python parser (e.g. it rejects flow mappings
+    like ``{min: 10, expr:'2'}``), content it fails on is parsed again with the pure python
+    parser, so specs which always loaded keep loading.
+
+    Parameters
+    ----------
+    content : str | bytes
+        Yaml formatted content.
+
+    Returns
+    -------
+    Any
+        Parsed content.
+    """
+    try:
+        return YAML(typ="safe").load(content)
+    except YAMLError:
+        return YAML(typ="safe", pure=True).load(content)
 
 
 def _write_dict(file_name: str, data: Mapping[str, Any]):
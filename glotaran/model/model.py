@@ -4,6 +4,7 @@ from __future__ import annotations
 import copy
 from dataclasses import asdict
 from typing import Any
+from typing import Iterator
 from typing import List
 from warnings import warn
 
@@ -89,10 +90,14 @@ class Model:
             default_megacomplex_type = model_dict.get("default_megacomplex")
 
         if megacomplex_types is None:
+            # Deduplicate the types first (keeping their order, since the first type is
+            # the fallback default megacomplex) to look up each type only once
+            used_types = dict.fromkeys(
+                m["type"] for m in model_dict["megacomplex"].values() if "type" in m
+            )
             megacomplex_types = {
-                m["type"]: get_megacomplex(m["type"])
-                for m in model_dict["megacomplex"].values()
-                if "type" in m
+                megacomplex_type: get_megacomplex(megacomplex_type)
+                for megacomplex_type in used_types
             }
         if (
             default_megacomplex_type is not None
@@ -115,7 +120,7 @@ class Model:
         )
 
         # iterate over items
-        for item_name, items in list(model_dict.items()):
+        for item_name, items in model_dict.items():
 
             if item_name not in model.model_items:
                 warn(f"Unknown model item type '{item_name}'.")
@@ -132,37 +137,47 @@ class Model:
 
     def _add_dict_items(self, item_name: str, items: dict):
 
+        base_item_cls = self.model_items[item_name]
+        is_typed = hasattr(base_item_cls, "_glotaran_model_item_typed")
+        if is_typed:
+            default_type = base_item_cls.get_default_type()
+            types = base_item_cls._glotaran_model_item_types
+        model_items = getattr(self, item_name)
+
         for label, item in items.items():
-            item_cls = self.model_items[item_name]
-            is_typed = hasattr(item_cls, "_glotaran_model_item_typed")
+            item_cls = base_item_cls
             if is_typed:
-                if "type" not in item and item_cls.get_default_type() is None:
+                if "type" not in item and default_type is None:
                     raise ValueError(f"Missing type for attribute '{item_name}'")
-                item_type = item.get("type", item_cls.get_default_type())
+                item_type = item.get("type", default_type)
 
-                types = item_cls._glotaran_model_item_types
                 if item_type not in types:
                     raise ValueError(f"Unknown type '{item_type}' for attribute '{item_name}'")
                 item_cls = types[item_type]
             item["label"] = label
             item = item_cls.from_dict(item)
-            getattr(self, item_name)[label] = item
+            model_items[label] = item
 
     def _add_list_items(self, item_name: str, items: list):
 
+        base_item_cls = self.model_items[item_name]
+        is_typed = hasattr(base_item_cls, "_glotaran_model_item_typed")
+        if is_typed:
+            types = base_item_cls._glotaran_model_item_types
+        model_items = getattr(self, item_name)
+
         for item in items:
-            item_cls = self.model_items[item_name]
-            is_typed = hasattr(item_cls, "_glotaran_model_item_typed")
+            item_cls = base_item_cls
             if is_typed:
                 if "type" not in item:
                     raise ValueError(f"Missing type for attribute '{item_name}'")
                 item_type = item["type"]
 
-                if item_type not in item_cls._glotaran_model_item_types:
+                if item_type not in types:
                     raise ValueError(f"Unknown type '{item_type}' for attribute '{item_name}'")
-                item_cls = item_cls._glotaran_model_item_types[item_type]
+                item_cls = types[item_type]
             item = item_cls.from_dict(item)
-            getattr(self, item_name).append(item)
+            model_items.append(item)
 
     def _add_megacomplexe_types(self):
 
@@ -345,18 +360,26 @@ class Model:
         parameter :
             The parameter to validate.
         """
-        problems = []
+        return list(self._iter_problems(parameters))
+
+    def _iter_problems(self, parameters: ParameterGroup = None) -> Iterator[str]:
+        """Iterate over all problems in the model and missing parameters if specified.
 
+        Parameters
+        ----------
+        parameters : ParameterGroup | None
+            The parameters to validate.
+
+        Yields
+        ------
+        str
+            A problem in the model.
+        """
         for name in self.model_items:
             items = getattr(self, name)
-            if isinstance(items, list):
-                for item in items:
-                    problems += item.validate(self, parameters=parameters)
-            else:
-                for _, item in items.items():
-                    problems += item.validate(self, parameters=parameters)
-
-        return problems
+            item_iterator = items if isinstance(items, list) else items.values()
+            for item in item_iterator:
+                yield from item.validate(self, parameters=parameters)
 
     def validate(self, parameters: ParameterGroup = None, raise_exception: bool = False) -> str:
         """
@@ -390,7 +413,7 @@ class Model:
         parameter :
             The parameter to validate.
         """
-        return len(self.problem_list(parameters)) == 0
+        return next(self._iter_problems(parameters), None) is None
 
     def markdown(
         self,